@@ -6,12 +6,14 @@ dual-axis chart of speed and longitudinal deceleration (a = dv/dt)
 through the Turn 1 braking zone.
 """
 
+import io
 import streamlit as st
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from scipy.ndimage import uniform_filter1d
 from pipeline import run_pipeline
+from generate_plots import braking_fill
 
 st.set_page_config(page_title="Monza T1 Braking", layout="wide")
 
@@ -74,10 +76,10 @@ def make_chart(data):
     ax_dec.plot(zone_b["Distance"].values, smooth_b, color=cb,
                 lw=1.8, label=f"{db} decel", alpha=0.85)
     ax_dec.axhline(0, color=muted, lw=0.6)
-    ax_dec.fill_between(zone_a["Distance"].values, 0, smooth_a,
-                        where=(smooth_a < 0), alpha=0.15, color=ca)
-    ax_dec.fill_between(zone_b["Distance"].values, 0, smooth_b,
-                        where=(smooth_b < 0), alpha=0.12, color=cb)
+    ax_dec.fill_between(*braking_fill(zone_a["Distance"].values, smooth_a),
+                        0, alpha=0.15, color=ca, lw=0)
+    ax_dec.fill_between(*braking_fill(zone_b["Distance"].values, smooth_b),
+                        0, alpha=0.12, color=cb, lw=0)
 
     ax_dec.text(0.02, 0.06,
                 f"Peak: {da} {peak_a:.2f}G  |  {db} {peak_b:.2f}G",
@@ -103,6 +105,20 @@ def make_chart(data):
     return fig
 
 
+@st.cache_data(ttl=3600)
+def get_chart_png():
+    """
+    Render the chart once and cache the PNG. Streamlit reruns the whole
+    script on every interaction, so without this each expander/tab click
+    rebuilt the figure and left it open in pyplot's figure manager.
+    """
+    fig = make_chart(get_data())
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
 def main():
     st.title("Monza T1 | Braking Deceleration")
     st.caption("2023 Italian GP Qualifying  /  VER vs SAI  /  Real FIA telemetry via FastF1")
@@ -124,8 +140,7 @@ def main():
         later = da if bp_a > bp_b else db
         st.info(f"**{later}** brakes **{diff:.0f} m later** into Turn 1.")
 
-    fig = make_chart(data)
-    st.pyplot(fig, use_container_width=True)
+    st.image(get_chart_png())
 
     with st.expander("Raw telemetry (T1 zone)"):
         tab1, tab2 = st.tabs([da, db])
@@ -13,6 +13,27 @@ from scipy.ndimage import uniform_filter1d
 from pipeline import run_pipeline
 
 
+def braking_fill(d, accel_g):
+    """
+    Shape a G trace for shading the braking area with one fill_between.
+
+    Positive samples are clipped to 0 and the linearly interpolated
+    zero crossings are inserted, so the shaded area meets the axis
+    exactly where the plotted line does (same as where=... with
+    interpolate=True, without the mask).
+    """
+    d = np.asarray(d, dtype=np.float64)
+    g = np.asarray(accel_g, dtype=np.float64)
+
+    # strict sign changes only: a sample at exactly 0 already touches the axis
+    i = np.flatnonzero(g[:-1] * g[1:] < 0)
+    d_cross = d[i] - g[i] * (d[i + 1] - d[i]) / (g[i + 1] - g[i])
+
+    d_fill = np.insert(d, i + 1, d_cross)
+    g_fill = np.insert(np.minimum(g, 0.0), i + 1, 0.0)
+    return d_fill, g_fill
+
+
 def save_braking_chart(data, out="results/braking_analysis.png"):
     """Dual-panel chart: speed + deceleration through T1."""
     zone_a = data["zone_a"]
@@ -66,10 +87,10 @@ def save_braking_chart(data, out="results/braking_analysis.png"):
              linewidth=1.8, label=f"{db} decel", alpha=0.85)
 
     ax2.axhline(0, color=muted, linewidth=0.6)
-    ax2.fill_between(zone_a["Distance"].values, 0, smooth_a,
-                     where=(smooth_a < 0), alpha=0.15, color=ca)
-    ax2.fill_between(zone_b["Distance"].values, 0, smooth_b,
-                     where=(smooth_b < 0), alpha=0.12, color=cb)
+    ax2.fill_between(*braking_fill(zone_a["Distance"].values, smooth_a),
+                     0, alpha=0.15, color=ca, linewidth=0)
+    ax2.fill_between(*braking_fill(zone_b["Distance"].values, smooth_b),
+                     0, alpha=0.12, color=cb, linewidth=0)
 
     peak_a = data["peak_decel_a"]
     peak_b = data["peak_decel_b"]
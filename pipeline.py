@@ -10,6 +10,10 @@ The physics:
     in m/s^2. Divide by 9.81 to express in G.
 """
 
+import contextlib
+import os
+import pickle
+import tempfile
 import numpy as np
 import pandas as pd
 import fastf1
@@ -20,10 +24,72 @@ import fastf1.plotting as fp
 T1_ENTRY = 600
 T1_EXIT = 1050
 
+# pickled fastest-lap telemetry, one file per (session, driver pair);
+# bump CACHE_VERSION whenever the ingest code changes what gets stored
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+CACHE_VERSION = 1
+
+
+def _fastlap_cache_path(year, gp, session_type, driver_a, driver_b):
+    name = (f"fastlaps_v{CACHE_VERSION}_{year}_{gp}_{session_type}"
+            f"_{driver_a}_{driver_b}.pkl")
+    return os.path.join(CACHE_DIR, name)
+
+
+def _read_fastlap_cache(path):
+    """
+    Return the cached laps, or None if missing or unreadable. Any
+    failure counts as a miss: a pickle written under another pandas or
+    numpy version can raise almost anything on load.
+    """
+    try:
+        with open(path, "rb") as f:
+            laps = pickle.load(f)
+    except Exception:
+        return None
+    return laps if isinstance(laps, dict) else None
+
+
+def _write_fastlap_cache(path, laps):
+    """
+    Best-effort write: the cache is only an optimisation, so a failed
+    write must not break the pipeline. Writing to a temp file and
+    os.replace()-ing it means a crash never leaves a truncated pickle.
+    """
+    tmp = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(laps, f, protocol=5)
+        os.replace(tmp, path)
+        tmp = None
+    except Exception:
+        pass
+    finally:
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+
 
 def load_qualifying_telemetry(year=2023, gp="Monza", session_type="Q",
-                               driver_a="VER", driver_b="SAI"):
-    """Pull real telemetry for two drivers' fastest qualifying laps."""
+                               driver_a="VER", driver_b="SAI", use_cache=True):
+    """
+    Pull real telemetry for two drivers' fastest qualifying laps.
+
+    Even with FastF1's own cache warm, session.load() re-parses the
+    whole session on every run. The two laps we need are pickled to
+    CACHE_DIR after the first load and read straight back on later
+    runs. Laps and telemetry are always returned as plain pandas
+    objects (the FastF1 subclasses drag the full Session along), so
+    both paths give the same types; "session" is None on a cache hit.
+    """
+    path = _fastlap_cache_path(year, gp, session_type, driver_a, driver_b)
+    if use_cache:
+        laps = _read_fastlap_cache(path)
+        if laps is not None:
+            return {**laps, "session": None}
+
     session = fastf1.get_session(year, gp, session_type)
     session.load()
 
@@ -36,13 +102,37 @@ def load_qualifying_telemetry(year=2023, gp="Monza", session_type="Q",
     color_a = fp.get_team_color(lap_a["Team"], session=session)
     color_b = fp.get_team_color(lap_b["Team"], session=session)
 
-    return {
-        "session": session,
-        "lap_a": lap_a, "lap_b": lap_b,
-        "tel_a": tel_a, "tel_b": tel_b,
+    laps = {
+        "lap_a": pd.Series(lap_a), "lap_b": pd.Series(lap_b),
+        "tel_a": pd.DataFrame(tel_a), "tel_b": pd.DataFrame(tel_b),
         "driver_a": driver_a, "driver_b": driver_b,
         "color_a": color_a, "color_b": color_b,
     }
+    if use_cache:
+        _write_fastlap_cache(path, laps)
+
+    return {**laps, "session": session}
+
+
+def telemetry_to_arrays(tel: pd.DataFrame):
+    """
+    Pull the columns the derivative needs out of a telemetry frame as
+    NumPy arrays, once: SessionTime [s] and Speed [km/h].
+
+    SessionTime is read from its int64 nanosecond buffer instead of
+    going through the .dt accessor. NaT samples become NaN, as they
+    would with .dt.total_seconds().
+    """
+    speed = tel["Speed"].to_numpy(dtype=np.float64)
+
+    session_time = tel["SessionTime"].to_numpy()
+    if np.issubdtype(session_time.dtype, np.timedelta64):
+        t = session_time.astype("timedelta64[ns]", copy=False).view("i8") * 1e-9
+        t[np.isnat(session_time)] = np.nan
+    else:
+        t = session_time.astype(np.float64, copy=False)
+
+    return t, speed
 
 
 def compute_deceleration(tel: pd.DataFrame) -> pd.DataFrame:
@@ -58,32 +148,40 @@ def compute_deceleration(tel: pd.DataFrame) -> pd.DataFrame:
     central differences (second-order accurate) at interior points.
     """
     df = tel.copy()
-
-    # elapsed time in seconds from session start
-    df["ElapsedSeconds"] = (
-        df["SessionTime"].dt.total_seconds()
-        if hasattr(df["SessionTime"].iloc[0], "total_seconds")
-        else df["SessionTime"]
-    )
+    t, speed = telemetry_to_arrays(df)
 
     # speed in m/s
-    df["Speed_ms"] = df["Speed"] * (1000.0 / 3600.0)
+    v = speed * (1000.0 / 3600.0)
+
+    df["ElapsedSeconds"] = t
+    df["Speed_ms"] = v
 
     # numerical derivative: a = dv/dt
     # np.gradient(f, x) computes df/dx directly using central differences
-    t = df["ElapsedSeconds"].values
-    v = df["Speed_ms"].values
-    df["Accel_ms2"] = np.gradient(v, t)
-    df["Accel_G"] = df["Accel_ms2"] / 9.81
+    # derive G from the raw array so we don't walk a second Series
+    accel = np.gradient(v, t)
+    df["Accel_ms2"] = accel
+    df["Accel_G"] = accel / 9.81
 
     return df
 
 
 def extract_braking_zone(df: pd.DataFrame,
                           d_start=T1_ENTRY, d_end=T1_EXIT) -> pd.DataFrame:
-    """Slice telemetry to the T1 braking zone by distance."""
-    mask = (df["Distance"] >= d_start) & (df["Distance"] <= d_end)
-    return df.loc[mask].copy()
+    """
+    Slice telemetry to the T1 braking zone by distance.
+
+    add_distance() integrates speed, so Distance is non-decreasing and
+    the zone is one contiguous block: two binary searches find it
+    without building a boolean mask over the whole lap.
+
+    Precondition: df must be sorted by Distance (as add_distance()
+    output is). On unsorted frames the slice is silently wrong.
+    """
+    d = df["Distance"].to_numpy()
+    lo = np.searchsorted(d, d_start, side="left")
+    hi = np.searchsorted(d, d_end, side="right")
+    return df.iloc[lo:hi].copy()
 
 
 def find_brake_point(df_zone: pd.DataFrame, threshold_g=-0.5):